@@ -1,13 +1,42 @@
 import sys
 import time
-import locale
+import ctypes
+import ctypes.wintypes
 import logging
-import win32gui
-import win32con
-import subprocess
-import pygetwindow as gw
+import threading
+import pythoncom
 import win32com.client as win32
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Deferred to their call sites to keep module import light; listed here
+    # so static analysis still sees them
+    import subprocess
+    import win32api
+    import win32con
+    import win32event
+    import win32gui
+
+# Win32 event-hook constants used to get notified of window creation
+EVENT_OBJECT_CREATE = 0x8000
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+# Prototype of the SetWinEventHook callback
+_WIN_EVENT_PROC = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE,  # hWinEventHook
+    ctypes.wintypes.DWORD,   # event
+    ctypes.wintypes.HWND,    # hwnd
+    ctypes.wintypes.LONG,    # idObject
+    ctypes.wintypes.LONG,    # idChild
+    ctypes.wintypes.DWORD,   # idEventThread
+    ctypes.wintypes.DWORD)   # dwmsEventTime
+
+# Portuguese month names, indexed by month number - 1. Avoids depending on
+# the host locale configuration when generating passwords.
+PT_MONTHS = ("Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+             "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro")
 
 # Define the SapGui class
 
@@ -59,34 +88,81 @@ class SapGui():
             # Path to SAPLogon executable
             self.path = sap_args['sap_path']
 
-            # Open SAPLogon
-            subprocess.Popen(self.path)
-            time.sleep(2)  # Give it some time to open
+            # Deferred import: only needed when SAPLogon must be spawned
+            import subprocess
 
-            # Connect to the SAP GUI Scripting engine
-            self.SapGuiAuto = win32.GetObject("SAPGUI")
-            if not isinstance(self.SapGuiAuto, win32.CDispatch):
+            # Cache of resolved SAP GUI elements keyed by scripting path
+            self._id_cache = {}
+
+            # Generate early-binding stubs for the SAP GUI typelib when it is
+            # registered, so property access skips GetIDsOfNames on every call
+            try:
+                win32.gencache.EnsureDispatch("SAPGUI")
+            except Exception:
+                pass  # typelib not registered, late binding still works
+
+            self.SapGuiAuto = None
+
+            def sap_gui_ready():
+                # GetActiveObject hits the running-object table directly,
+                # skipping GetObject's moniker-parsing path
+                try:
+                    engine = pythoncom.GetActiveObject("SAPGUI")
+                    self.SapGuiAuto = win32.Dispatch(
+                        engine.QueryInterface(pythoncom.IID_IDispatch))
+                except pythoncom.com_error:
+                    # Some installs only register through the moniker path,
+                    # SAP's documented entry point
+                    self.SapGuiAuto = win32.GetObject("SAPGUI")
+                return True
+
+            # Reuse a running SAPLogon instance if its scripting engine is
+            # already registered; only spawn a new process when it is not
+            try:
+                sap_gui_ready()
+            except Exception:
+                proc = subprocess.Popen(self.path)
+
+                # Block until SAPLogon's message pump is ready to accept
+                # input, rather than approximating startup with a sleep
+                try:
+                    import win32api
+                    import win32con
+                    import win32event
+                    handle = win32api.OpenProcess(
+                        win32con.PROCESS_QUERY_INFORMATION | win32con.SYNCHRONIZE,
+                        False, proc.pid)
+                    win32event.WaitForInputIdle(handle, 5000)
+                    win32api.CloseHandle(handle)
+                except Exception:
+                    pass  # the readiness poll below still covers startup
+
+                self._wait_until(sap_gui_ready, timeout=10, interval=0.05)
+
+            # With early binding the dispatch objects are makepy-generated
+            # classes rather than CDispatch, so only check for None
+            if self.SapGuiAuto is None:
                 return None
 
             # Get the SAP Scripting engine
             application = self.SapGuiAuto.GetScriptingEngine
-            if not isinstance(application, win32.CDispatch):
+            if application is None:
                 self.SapGuiAuto = None
                 return None
 
             # Open a connection to the SAP system
             self.connection = application.OpenConnection(self.system, True)
-            if not isinstance(self.connection, win32.CDispatch):
+            if self.connection is None:
                 application = None
                 self.SapGuiAuto = None
                 return None
 
-            # Wait for the connection to be established
-            time.sleep(3)
+            # Wait for the connection to expose a session
+            self._wait_until(lambda: self.connection.Children.Count > 0, timeout=10)
 
             # Get the first available session
             self.session = self.connection.Children(0)
-            if not isinstance(self.session, win32.CDispatch):
+            if self.session is None:
                 self.connection = None
                 application = None
                 self.SapGuiAuto = None
@@ -99,9 +175,92 @@ class SapGui():
             # self.session.findById("wnd[0]").maximize()
 
         except Exception as e:
-            logging.error(f"An exception occurred in __init__: {str(e)}")
+            logging.error("An exception occurred in __init__: %s", e)
             return None
 
+    def _wait_until(self, predicate, timeout, interval=0.1):
+        """
+        Polls a predicate until it returns a truthy value or the timeout expires.
+
+        Args:
+            predicate (callable): Callable evaluated on each poll; exceptions are treated as "not ready yet".
+            timeout (float): Maximum number of seconds to keep polling.
+            interval (float, optional): Delay between polls in seconds. Defaults to 0.1.
+
+        Returns:
+            bool: True as soon as the predicate succeeds, False if the timeout expires.
+        """
+        start_time = time.time()
+        while time.time() - start_time < timeout:
+            try:
+                if predicate():
+                    return True
+            except Exception:
+                pass
+            time.sleep(interval)
+        return False
+
+    def _find(self, path):
+        """
+        Resolves a SAP GUI element by scripting path, caching the dispatch object.
+
+        Repeated lookups of the same path skip the cross-process COM tree walk.
+        The cache is cleared whenever a window transition invalidates the tree.
+
+        Args:
+            path (str): SAP GUI Scripting ID of the element.
+
+        Returns:
+            object: The resolved element, or None if it does not exist.
+        """
+        obj = self._id_cache.get(path)
+        if obj is None:
+            obj = self.session.findById(path, False)
+            self._id_cache[path] = obj
+        return obj
+
+    @staticmethod
+    def _first_empty_row(row_count, read_cell):
+        """
+        Binary-searches for the first row whose cell text is empty.
+
+        Assumes rows are filled contiguously from the top, which is the same
+        assumption the previous linear probe relied on.
+
+        Args:
+            row_count (int): Total number of rows in the table.
+            read_cell (callable): Callable returning the cell text for a row index.
+
+        Returns:
+            int: Index of the first empty row (row_count if none is empty).
+        """
+        low, high = 0, row_count
+        while low < high:
+            mid = (low + high) // 2
+            if read_cell(mid) == "":
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    @staticmethod
+    def _column_name(cell_path):
+        """
+        Extracts the ABAP column name from a cell path template.
+
+        For example "wnd[0]/usr/tblX/txtZREC-MATNR[0,{}]" yields "MATNR".
+
+        Args:
+            cell_path (str): Cell path template as passed to set_cell_value.
+
+        Returns:
+            str: The column name understood by GetCellValue.
+        """
+        field = cell_path.rsplit("/", 1)[-1].split("[", 1)[0]
+        # Strip the lowercase control-type prefix (txt, ctxt, pwd, ...)
+        field = field.lstrip("abcdefghijklmnopqrstuvwxyz")
+        return field.rsplit("-", 1)[-1]
+
     def handle_password_change(self):
         """
         Handles the password change prompt during SAP login.
@@ -114,13 +273,6 @@ class SapGui():
             bool: True if the password change was successful and the user is logged in, False otherwise.
         """
         try:
-            # Ensure the locale is set to Portuguese for correct month formatting
-            try:
-                locale.setlocale(locale.LC_TIME, 'pt_PT.UTF-8')
-            except locale.Error as e:
-                logging.error(f"Locale setting failed: {str(e)}")
-                return False
-
             # Check if a password change window is active (usually wnd[1])
             active_window = self.session.ActiveWindow
             if active_window.Name != "wnd[1]":
@@ -128,7 +280,7 @@ class SapGui():
                 return True
 
             # Retrieve the popup window and its title
-            popup_window = self.session.findById("wnd[1]")
+            popup_window = self._find("wnd[1]")
             popup_title = popup_window.Text.lower()
 
             # Ensure it's a password change prompt by checking the title
@@ -143,14 +295,14 @@ class SapGui():
                     logging.error("No valid password change prompt detected.")
                     return False
             except Exception as e:
-                logging.error(f"Failed to find password change label: {str(e)}")
+                logging.error("Failed to find password change label: %s", e)
                 return False
 
             logging.info("Password change prompt detected.")
 
             # Generate new password in 'Month#Year' format (e.g., 'Maio#2024')
-            new_password = f"{datetime.now().strftime('%B').capitalize()}#{datetime.now().strftime('%Y')}"
-            logging.info(f"Generated new password: {new_password}")
+            now = datetime.now()
+            new_password = f"{PT_MONTHS[now.month - 1]}#{now.year:04d}"
 
             # Input the new password into both fields
             popup_window.findById("usr/pwdRSYST-NCODE").text = new_password
@@ -159,11 +311,14 @@ class SapGui():
             # Confirm the password change
             popup_window.findById("tbar[0]/btn[0]").press()
 
-            # Wait for a short while to allow the change to take effect
-            time.sleep(3)
+            # The window tree changed, so cached elements are stale
+            self._id_cache.clear()
+
+            # Wait for the login screen to confirm the change took effect
+            self._wait_until(lambda: self.session.findById("wnd[0]/tbar[0]/btn[15]", False), timeout=10)
 
             # Check if the user is logged in successfully after password change
-            if self.session.findById("wnd[0]/tbar[0]/btn[15]", False):
+            if self._find("wnd[0]/tbar[0]/btn[15]"):
                 logging.info("Password changed successfully and user logged in.")
                 return True
             else:
@@ -172,7 +327,7 @@ class SapGui():
 
         except Exception as e:
             # Log any errors that occur during the process
-            logging.error(f"Error during password change handling: {str(e)}")
+            logging.error("Error during password change handling: %s", e)
             return False
 
     def sapLogin(self):
@@ -183,17 +338,25 @@ class SapGui():
             bool: True if login is successful, False otherwise.
         """
         try:
-            # Set the SAP login credentials and language in the GUI
-            self.session.findById("wnd[0]/usr/txtRSYST-MANDT").text = self.client  # Mandante
-            self.session.findById("wnd[0]/usr/txtRSYST-BNAME").text = self.user  # Utilizador
-            self.session.findById("wnd[0]/usr/pwdRSYST-BCODE").text = self.password  # Password
-            self.session.findById("wnd[0]/usr/txtRSYST-LANGU").text = self.language  # Idioma
+            # Resolve the login screen container once and set the fields by
+            # name instead of walking the full absolute path four times
+            login_area = self._find("wnd[0]/usr")
+            login_area.findByName("RSYST-MANDT", "GuiTextField").text = self.client  # Mandante
+            login_area.findByName("RSYST-BNAME", "GuiTextField").text = self.user  # Utilizador
+            login_area.findByName("RSYST-BCODE", "GuiPasswordField").text = self.password  # Password
+            login_area.findByName("RSYST-LANGU", "GuiTextField").text = self.language  # Idioma
 
             # Perform the login
-            self.session.findById("wnd[0]").sendVKey(0)
+            self._find("wnd[0]").sendVKey(0)
+            self._id_cache.clear()
 
-            # Wait for a short time to see if any popup appears
-            time.sleep(2)
+            # Poll the possible post-login outcomes together in one loop so
+            # the wait lasts only until the first of them becomes visible
+            self._wait_until(
+                lambda: self.session.ActiveWindow.Name == "wnd[1]"
+                or self.session.findById("wnd[1]", False) is not None
+                or self.session.findById("wnd[0]/tbar[0]/btn[15]", False) is not None,
+                timeout=10)
 
             # Handle password change if required
             if not self.handle_password_change():
@@ -203,14 +366,15 @@ class SapGui():
             # Check for the specific popup window
             if self.session.ActiveWindow.Name == "wnd[1]":
                 # Check if the popup is the multiple login warning by checking some unique text or title
-                if "logon múltiplo" in self.session.findById("wnd[1]").Text:
+                if "logon múltiplo" in self._find("wnd[1]").Text:
                     logging.info("Multiple logins detected. Closing other sessions.")
                     # Select the option to close other sessions and click OK
-                    self.session.findById("wnd[1]/usr/radMULTI_LOGON_OPT1").select()
-                    self.session.findById("wnd[1]/tbar[0]/btn[0]").press()
+                    self._find("wnd[1]/usr/radMULTI_LOGON_OPT1").select()
+                    self._find("wnd[1]/tbar[0]/btn[0]").press()
+                    self._id_cache.clear()
 
             # Check if login is successful by finding a UI element that appears only when logged in
-            if self.session.findById("wnd[0]/tbar[0]/btn[15]"):
+            if self._find("wnd[0]/tbar[0]/btn[15]"):
                 # login sucessfull
                 logging.info("Successfully connected to SAP.")
                 return True
@@ -220,7 +384,7 @@ class SapGui():
                 return False
 
         except Exception as e:
-            logging.error(f"Error during SAP login: {str(e)}")
+            logging.error("Error during SAP login: %s", e)
             logging.error(sys.exc_info())
 
     def close_connection(self):
@@ -244,7 +408,7 @@ class SapGui():
         except Exception as e:
             # Handle any exceptions that may occur during the closing process
             # Log an error message with details about the exception
-            logging.error(f"Error closing SAP connection: {str(e)}")
+            logging.error("Error closing SAP connection: %s", e)
 
     def sapLogout(self):
         """
@@ -261,12 +425,13 @@ class SapGui():
         """
         try:
             # Enter the logout command '/nex' in the command field
-            self.session.findById("wnd[0]/tbar[0]/okcd").text = "/nex"
-            self.session.findById("wnd[0]").sendVKey(0)
+            self._find("wnd[0]/tbar[0]/okcd").text = "/nex"
+            self._find("wnd[0]").sendVKey(0)
+            self._id_cache.clear()
 
             logging.info("Successfully logged out of SAP.")
         except Exception as e:
-            logging.error(f"Error during SAP logout: {str(e)}")
+            logging.error("Error during SAP logout: %s", e)
 
     @staticmethod
     def get_dates():
@@ -278,15 +443,11 @@ class SapGui():
         """
         current_date = datetime.now()
 
-        # Get the first day of the current month
-        first_day_current_month = current_date.replace(day=1)
-
-        # Subtract one day from the first day of the current month to get the last day of the previous month
-        previous_month_last_day = first_day_current_month - timedelta(days=1)
+        # Step back over the first day of the current month to land in the
+        # previous month, then snap to its first day
+        previous_month_first_day = (current_date.replace(day=1) - timedelta(days=1)).replace(day=1)
 
-        # Set the start_date as the first day of the previous month
-        start_date = previous_month_last_day.replace(
-            day=1).strftime("%d.%m.%Y")
+        start_date = previous_month_first_day.strftime("%d.%m.%Y")
         end_date = current_date.strftime("%d.%m.%Y")
 
         return start_date, end_date
@@ -295,6 +456,7 @@ class SapGui():
     def wait_for_element(self, element_id, timeout=60):
         """
         Waits for the SAP GUI element with the specified ID to appear within the given timeout.
+
         Args:
             element_id (str): SAP GUI Scripting ID of the element to wait for.
             timeout (int, optional): The number of seconds to wait for the element. Defaults to 60.
@@ -303,12 +465,17 @@ class SapGui():
             bool: True if the element appears within the timeout, otherwise False.
         """
         start_time = time.time()
+        delay = 0.05
         while time.time() - start_time < timeout:
             try:
-                if self.session.findById(element_id):
+                # Second argument disables raising so a miss returns None
+                if self.session.findById(element_id, False):
                     return True
             except Exception:
-                time.sleep(1)  # wait for 1 second before trying again
+                pass
+            # Back off exponentially so long waits stop hammering COM
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
         return False
 
     def check_element_exists(self, element_path):
@@ -321,34 +488,100 @@ class SapGui():
         Returns:
             bool: True if the element exists, otherwise False.
         """
+        # The optional flag makes a miss return None instead of raising
+        return self.session.findById(element_path, False) is not None
 
-        try:
-            self.session.findById(element_path)
+    @staticmethod
+    def _window_with_title(title):
+        """
+        Finds a top-level window whose title contains the given text.
+
+        Tries an exact FindWindow lookup first; only when that misses does it
+        fall back to a substring scan over the top-level windows, stopping at
+        the first match.
+
+        Args:
+            title (str): Text the window title must contain.
+
+        Returns:
+            int: The window handle, or 0 if no window matches.
+        """
+        import win32gui
+
+        hwnd = win32gui.FindWindow(None, title)
+        if hwnd:
+            return hwnd
+
+        matches = []
+
+        def on_window(hwnd, _):
+            if title in win32gui.GetWindowText(hwnd):
+                matches.append(hwnd)
+                return False  # stop enumerating
             return True
+
+        try:
+            win32gui.EnumWindows(on_window, None)
         except Exception:
-            return False
+            pass  # EnumWindows raises when the callback stops it early
+        return matches[0] if matches else 0
 
     def wait_for_save_as_dialog(self, title, max_attempts=10):
         """
-        Waits for a dialog window with the specified title to appear.
+        Waits for a dialog window whose title contains the specified text to appear.
 
-        This function attempts to detect the appearance of a dialog window by checking if a window
-        with the given title is present. It waits between each attempt for the window to appear,
-        up to a specified maximum number of attempts.
+        Instead of repeatedly enumerating every top-level window, this installs a
+        Win32 event hook that fires the moment a window is created, and pumps
+        messages until the hook reports a window matching the given title.
 
         Parameters:
-        title (str): The title of the dialog window to wait for.
-        max_attempts (int): The maximum number of attempts to check for the window. Default is 10.
+        title (str): Text the dialog title must contain; a substring is enough,
+            matching save-as dialogs that append the file name.
+        max_attempts (int): Number of seconds to wait for the window. Default is 10.
 
         Returns:
-        bool: True if the dialog window is detected within the max_attempts, otherwise False.
+        bool: True if the dialog window is detected within the timeout, otherwise False.
         """
-        for attempt in range(max_attempts):
-            if gw.getWindowsWithTitle(title):
+        import win32gui
+
+        # The dialog may already be open
+        if self._window_with_title(title):
+            return True
+
+        found = threading.Event()
+
+        def on_window_created(hook, event, hwnd, id_object, id_child, thread_id, timestamp):
+            if title in win32gui.GetWindowText(hwnd):
+                found.set()
+
+        callback = _WIN_EVENT_PROC(on_window_created)
+        hook = ctypes.windll.user32.SetWinEventHook(
+            EVENT_OBJECT_CREATE, EVENT_OBJECT_CREATE,
+            0, callback, 0, 0, WINEVENT_OUTOFCONTEXT)
+
+        try:
+            # Close the race with dialogs created before the hook was in place
+            if self._window_with_title(title):
                 return True
-            time.sleep(1)  # Wait for 1 second before the next attempt
 
-        return False
+            deadline = time.time() + max_attempts
+            next_scan = time.time() + 0.5
+            while time.time() < deadline:
+                # Out-of-context hooks deliver through the message queue
+                win32gui.PumpWaitingMessages()
+                if found.is_set():
+                    return True
+                # Rescan occasionally in case the hook failed to install or
+                # the dialog's caption was set only after creation
+                if not hook or time.time() >= next_scan:
+                    if self._window_with_title(title):
+                        return True
+                    next_scan = time.time() + 0.5
+                time.sleep(0.05)
+            return found.is_set()
+        finally:
+            if hook:
+                ctypes.windll.user32.UnhookWinEvent(hook)
 
     def get_sap_element_text(self, element_path):
         """
@@ -360,11 +593,15 @@ class SapGui():
         Returns:
             str: The text of the SAP element, or None if the element is not found or an error occurs.
         """
+        element = self._find(element_path)
+        if element is None:
+            logging.debug("Element %s not found.", element_path)
+            return None
         try:
-            element = self.session.FindById(element_path)
             return element.Text
         except Exception as e:
-            print(f"Error: {e}")
+            # The element can vanish between the lookup and the read
+            logging.debug("Failed to read text of %s: %s", element_path, e)
             return None
 
     def bring_dialog_to_top(self, title):
@@ -375,14 +612,16 @@ class SapGui():
         shows it, and brings it to the top of the screen.
 
         Parameters:
-        title (str): The title of the dialog window to bring to the top.
+        title (str): Text the dialog title must contain; a substring is enough.
 
         Returns:
         bool: True if the window was found and brought to the top, False otherwise.
         """
-        save_as_window = gw.getWindowsWithTitle(title)
-        if save_as_window:
-            window_handle = save_as_window[0]._hWnd
+        import win32con
+        import win32gui
+
+        window_handle = self._window_with_title(title)
+        if window_handle:
             try:
                 # Restore the window if minimized
                 win32gui.ShowWindow(window_handle, win32con.SW_RESTORE)
@@ -397,10 +636,26 @@ class SapGui():
         return False
 
     def scroll_to_field(self, field_path):
-        try:
-            self.session.findById(field_path).setFocus()
-        except Exception:
-            self.session.findById(field_path.split("/")[:-1].join("/")).verticalScrollbar.position += 1
+        """
+        Focuses a field, scrolling its parent container if it is not visible.
+
+        Args:
+            field_path (str): SAP GUI Scripting ID of the field.
+
+        Returns:
+            None
+        """
+        field = self._find(field_path)
+        if field is not None:
+            field.setFocus()
+        else:
+            # Field not reachable yet: scroll the parent container one step
+            parent_path = "/".join(field_path.split("/")[:-1])
+            parent = self._find(parent_path)
+            if parent is not None:
+                parent.verticalScrollbar.position += 1
+                # Scrolling rebuilds the screen, so cached elements are stale
+                self._id_cache.clear()
 
     def set_cell_value(self, column_path, text):
         """
@@ -413,15 +668,41 @@ class SapGui():
         Returns:
             None
         """
-        # Find the first empty row
+        # Split the template once so the loops below skip str.format's
+        # per-call brace parsing
+        prefix, suffix = column_path.split("{}", 1)
+
+        # Resolve the owning container once to pick the cheapest search
+        parent_path = column_path.rsplit("/", 1)[0]
+        parent = self.session.findById(parent_path, False)
+        parent_type = getattr(parent, "Type", "") if parent is not None else ""
+
+        if parent_type == "GuiGridView":
+            # GridView exposes bulk accessors, so binary-search the column
+            column_name = self._column_name(column_path)
+            row_number = self._first_empty_row(
+                parent.RowCount,
+                lambda row: parent.GetCellValue(row, column_name))
+
+            # Grid cells are not addressable through findById paths, so
+            # write through the grid itself
+            if row_number < parent.RowCount:
+                parent.ModifyCell(row_number, column_name, text)
+                parent.SetCurrentCell(row_number, column_name)
+                self._find("wnd[0]").sendVKey(0)
+                self._id_cache.clear()
+
+            return row_number
+
+        # Table controls only materialize the rows inside the viewport
+        # with viewport-relative indices, so probing arbitrary absolute
+        # rows is not possible; they and generic containers keep the
+        # linear probe over whatever rows are reachable
         row_number = 0
-        cell_path = column_path.format(row_number)
-        cell = self.session.findById(cell_path)
-
+        cell = self._find(f"{prefix}{row_number}{suffix}")
         while cell and cell.Text != "":
             row_number += 1
-            cell_path = column_path.format(row_number)
-            cell = self.session.findById(cell_path)
+            cell = self._find(f"{prefix}{row_number}{suffix}")
 
         # Check if a blank cell was found
         if cell:
@@ -429,31 +710,38 @@ class SapGui():
             cell.Text = text
             cell.setFocus()
             cell.caretPosition = 4
-            self.session.findById("wnd[0]").sendVKey(0)
+            self._find("wnd[0]").sendVKey(0)
+            self._id_cache.clear()
 
         return row_number
 
     # Enter a command in the SAP command field, submit, and perform additional operations.
-    def perform_operation(self, command):
+    def perform_operation(self, command, wait_for=None, timeout=15):
         """
         Performs the specified command in the SAP GUI.
 
         Args:
             command (str): The command to be executed.
+            wait_for (str, optional): SAP GUI Scripting ID of an element that must
+                appear on the resulting screen. When None, no wait is performed.
+            timeout (int, optional): Seconds to wait for the element. Defaults to 15.
 
         Returns:
             None
         """
         try:
             # Set the value of the specified field and Submit the command
-            self.session.findById("wnd[0]/tbar[0]/okcd").text = command
-            self.session.findById("wnd[0]").sendVKey(0)
-
-            # Wait for the specific element from the new page to be present
-            element_to_wait_for = "element_here"
-            if self.wait_for_element(element_to_wait_for):
-                logging.info("Element found.")
-            else:
-                logging.error(f"Element {element_to_wait_for} not found.")
+            self._find("wnd[0]/tbar[0]/okcd").text = command
+            self._find("wnd[0]").sendVKey(0)
+
+            # The command navigated away, so cached elements are stale
+            self._id_cache.clear()
+
+            # Wait for the caller's post-condition element, if any
+            if wait_for is not None:
+                if self.wait_for_element(wait_for, timeout):
+                    logging.info("Element found.")
+                else:
+                    logging.error("Element %s not found.", wait_for)
         except Exception as e:
-            logging.error(f"Error during command execution: {str(e)}")
+            logging.error("Error during command execution: %s", e)